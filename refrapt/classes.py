@@ -8,7 +8,6 @@ import re
 from functools import partial
 from dataclasses import dataclass
 import collections
-from pathlib import Path
 from abc import ABC, abstractmethod
 
 import tqdm
@@ -19,6 +18,15 @@ from refrapt.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+_checksumLinePattern  = re.compile(r"^ +(.*)$")                    # Entry within a Release file checksum field
+_indexFileTailPattern = re.compile(r"[^./]*(\.gz|\.bz2|\.xz|$)$") # Remainder of a Packages or Sources filename after its prefix
+
+# Release file fields listing the checksum, size and name of each Index file
+_checksumFields = ("MD5Sum:", "SHA1:", "SHA256:")
+
+# Index file fields required to determine the files to download
+_indexKeywords = frozenset(["Filename", "MD5sum", "SHA1", "SHA256", "Size", "Files", "Directory"])
+
 class RepositoryType(Enum):
     """Distinguish between Binary and Source mirrors."""
     Bin = 0
@@ -64,12 +72,10 @@ class Repository:
         self._clean = True
 
         # Remove any inline comments
-        if "#" in line:
-            line = line[0:line.index("#")]
+        line = line.partition("#")[0]
 
         # Break down the line into its parts
-        elements = line.split(" ")
-        elements = list(filter(None, elements))
+        elements = line.split()
 
         # Determine Repository type
         if elements[0] == "deb":
@@ -82,7 +88,7 @@ class Repository:
         # If Architecture(s) is specified, store it, else set the default
         if "[" in line and "]" in line:
             # Architecture is defined
-            archList = line.split("[")[1].split("]")[0].replace("arch=", "")
+            archList = line.partition("[")[2].partition("]")[0].replace("arch=", "")
             self._architectures = archList.split(",")
             elementIndex += 1
         else:
@@ -98,6 +104,11 @@ class Repository:
             self._distribution = ""
             self._components = []
 
+        # Base Url of the Release files, shared by all files listed within them
+        self._baseUrl = self._uri + "/"
+        if self._components:
+            self._baseUrl += "dists/" + self._distribution + "/"
+
         self._packageCollection = PackageCollection(self._components, self._architectures)
         self._sourceCollection  = SourceCollection(self._components)
 
@@ -126,20 +137,9 @@ class Repository:
 
         """
 
-        baseUrl = self._uri + "/"
-        if self._components:
-            baseUrl += "dists/" + self._distribution + "/"
-
-        releaseFiles = []
-
-        releaseFiles.append(baseUrl + "InRelease")
-        releaseFiles.append(baseUrl + "Release")
-        releaseFiles.append(baseUrl + "Release.gpg")
-
-        for file in releaseFiles:
-            file = os.path.normpath(file)
+        baseUrl = self._baseUrl
 
-        return releaseFiles
+        return [baseUrl + "InRelease", baseUrl + "Release", baseUrl + "Release.gpg"]
 
     def _ParseReleaseFiles(self, rootPath: str) -> list:
         """
@@ -165,9 +165,7 @@ class Repository:
             - https://wiki.debian.org/DebianRepository/Format#MD5Sum.2C_SHA1.2C_SHA256
         """
 
-        baseUrl = self._uri + "/"
-        if self._components:
-            baseUrl += "dists/" + self._distribution + "/"
+        baseUrl = self._baseUrl
 
         inReleaseFilePath = rootPath + "/" + SanitiseUri(baseUrl) + "/InRelease"
         releaseFilePath   = rootPath + "/" + SanitiseUri(baseUrl) + "/Release"
@@ -183,15 +181,66 @@ class Repository:
 
         indexFiles = []
 
+        # Settings are constant while the file is read, so look them up once
+        contents  = Settings.Contents()
+        byHash    = Settings.ByHash()
+        languages = Settings.Language()
+
+        # Build the prefixes and patterns for each Architecture and Component once, rather than for every file listed.
+        # Literal prefixes are checked with string methods; only the checks needing a pattern are compiled.
+        contentsPrefixes  = dict() # type: dict[str, str]
+        binaryPatterns    = dict() # type: dict[str, list[tuple[str, dict]]] # For each architecture, each component, prefixes, patterns and by-hash Urls
+        for architecture in self._architectures:
+            contentsPrefixes[architecture] = f"Contents-{architecture}"
+            binaryPatterns[architecture]   = [(component, {
+                "component"   : f"{component}/",
+                "contents"    : f"{component}/Contents-{architecture}",
+                "release"     : f"{component}/binary-{architecture}/Release",
+                "packages"    : f"{component}/binary-{architecture}/Packages",
+                "commands"    : f"{component}/cnf/Commands-{architecture}",
+                "i18nCommands": f"{component}/i18n/cnf/Commands-{architecture}",
+                "i18nIndex"   : f"{component}/i18n/Index",
+                "dep11"       : re.compile(rf"{component}/dep11/(Components-{architecture}\.yml|icons-[^./]+\.tar)"),
+                "translations": tuple(f"{component}/i18n/Translation-{language}" for language in languages),
+                "binaryByHash": f"{baseUrl}{component}/binary-{architecture}/by-hash/",
+                "cnfByHash"   : f"{baseUrl}{component}/cnf/by-hash/",
+                "i18nByHash"  : f"{baseUrl}{component}/i18n/by-hash/",
+                "dep11ByHash" : f"{baseUrl}{component}/dep11/by-hash/"
+            }) for component in self._components]
+
+        sourcePatterns = [(component, {
+            "release"    : f"{component}/source/Release",
+            "sources"    : f"{component}/source/Sources"
+        }) for component in self._components]
+
+        # Combine every pattern into a single alternation, so that files of no interest are discarded with one match
+        alternatives = [] # type: list[str]
+        if self._components:
+            if self._repositoryType == RepositoryType.Bin:
+                for architecture in self._architectures:
+                    if contents:
+                        alternatives.append(re.escape(contentsPrefixes[architecture]))
+                    for component, patterns in binaryPatterns[architecture]:
+                        if contents:
+                            alternatives.append(".*" + re.escape(patterns["contents"])) # Found anywhere rather than at the start
+                        alternatives += [re.escape(patterns[key]) for key in ("release", "packages", "commands", "i18nCommands", "i18nIndex")]
+                        alternatives += [re.escape(prefix) for prefix in patterns["translations"]]
+                        alternatives.append(patterns["dep11"].pattern)
+            elif self._repositoryType == RepositoryType.Src:
+                for component, patterns in sourcePatterns:
+                    alternatives += [re.escape(patterns["release"]), re.escape(patterns["sources"]) + _indexFileTailPattern.pattern]
+
+        relevantPattern = re.compile("|".join(f"(?:{alternative})" for alternative in alternatives)) if alternatives else None
+
         with open(releaseFileToRead) as f:
             for line in f:
-                if ("SHA256:" in line or "SHA1:" in line or "MD5Sum:" in line) and "Hash:" not in line:
-                    checksumType = line
-                    checksumType = checksumType.replace(":", "").strip()
+                checksumField = line.startswith(_checksumFields)
+                if checksumField:
+                    checksumType = line.partition(":")[0] # The field name is a prefix of the line
                     checksums = False
 
                 if checksums:
-                    if re.search("^ +(.*)$", line):
+                    if _checksumLinePattern.search(line):
                         parts = list(filter(None, line.split(" ")))
 
                         # parts[0] = checksum
@@ -205,76 +254,75 @@ class Repository:
                         checksum = parts[0].strip()
                         filename = parts[2].rstrip()
 
+                        if relevantPattern and not relevantPattern.match(filename):
+                            continue
+
+                        url      = f"{baseUrl}{filename}"
+                        hashPath = f"{checksumType}/{checksum}"
+
                         if self._repositoryType == RepositoryType.Bin:
                             for architecture in self._architectures:
-                                if Settings.Contents():
-                                    if re.match(rf"Contents-{architecture}", filename):
-                                        indexFiles.append(f"{baseUrl}{filename}")
+                                if contents:
+                                    if filename.startswith(contentsPrefixes[architecture]):
+                                        indexFiles.append(url)
 
                                 if self._components:
-                                    for component in self._components:
-                                        if Settings.Contents():
-                                            if re.search(rf"{component}/Contents-{architecture}", filename):
-                                                indexFiles.append(f"{baseUrl}{filename}")
-
-                                        binaryByHash = rf"{baseUrl}{component}/binary-{architecture}/by-hash/{checksumType}/{checksum}"
-
-                                        if re.match(rf"{component}/binary-{architecture}/Release", filename):
-                                            indexFiles.append(f"{baseUrl}{filename}")
-                                            if Settings.ByHash():
-                                                indexFiles.append(binaryByHash)
-
-                                        if re.match(rf"{component}/binary-{architecture}/Packages", filename):
-                                            indexFiles.append(f"{baseUrl}{filename}")
-
-                                            if re.match(rf"{component}/binary-{architecture}/Packages[^./]*(\.gz|\.bz2|\.xz|$)$", filename):
-                                                self._packageCollection.Add(component, architecture, f"{baseUrl}{filename}")
-                                            if Settings.ByHash():
-                                                indexFiles.append(binaryByHash)
-
-                                        if re.match(rf"{component}/cnf/Commands-{architecture}", filename):
-                                            indexFiles.append(f"{baseUrl}{filename}")
-                                            if Settings.ByHash():
-                                                indexFiles.append(rf"{baseUrl}{component}/cnf/by-hash/{checksumType}/{checksum}")
-
-                                        i18nByHash = rf"{baseUrl}{component}/i18n/by-hash/{checksumType}/{checksum}"
-
-                                        if re.match(rf"{component}/i18n/cnf/Commands-{architecture}", filename):
-                                            indexFiles.append(f"{baseUrl}{filename}")
-                                            if Settings.ByHash():
-                                                indexFiles.append(i18nByHash)
-
-                                        if re.match(rf"{component}/i18n/Index", filename):
-                                            indexFiles.append(f"{baseUrl}{filename}")
-                                            if Settings.ByHash():
-                                                indexFiles.append(i18nByHash)
-
-                                        for language in Settings.Language():
-                                            if re.match(rf"{component}/i18n/Translation-{language}", filename):
-                                                indexFiles.append(f"{baseUrl}{filename}")
-                                                if Settings.ByHash():
-                                                    indexFiles.append(i18nByHash)
-
-                                        if re.match(rf"{component}/dep11/(Components-{architecture}\.yml|icons-[^./]+\.tar)", filename):
-                                            indexFiles.append(f"{baseUrl}{filename}")
-                                            if Settings.ByHash():
-                                                indexFiles.append(f"{baseUrl}{component}/dep11/by-hash/{checksumType}/{checksum}")
+                                    for component, patterns in binaryPatterns[architecture]:
+                                        if contents:
+                                            if patterns["contents"] in filename:
+                                                indexFiles.append(url)
+
+                                        # The remaining checks all share the Component prefix, so skip them if it is absent
+                                        if not filename.startswith(patterns["component"]):
+                                            continue
+
+                                        # The remaining prefixes are mutually exclusive, so stop at the first that matches
+                                        if filename.startswith(patterns["release"]):
+                                            indexFiles.append(url)
+                                            if byHash:
+                                                indexFiles.append(patterns["binaryByHash"] + hashPath)
+                                        elif filename.startswith(patterns["packages"]):
+                                            indexFiles.append(url)
+
+                                            if _indexFileTailPattern.match(filename, len(patterns["packages"])):
+                                                self._packageCollection.Add(component, architecture, url)
+                                            if byHash:
+                                                indexFiles.append(patterns["binaryByHash"] + hashPath)
+                                        elif filename.startswith(patterns["commands"]):
+                                            indexFiles.append(url)
+                                            if byHash:
+                                                indexFiles.append(patterns["cnfByHash"] + hashPath)
+                                        elif filename.startswith(patterns["i18nCommands"]):
+                                            indexFiles.append(url)
+                                            if byHash:
+                                                indexFiles.append(patterns["i18nByHash"] + hashPath)
+                                        elif filename.startswith(patterns["i18nIndex"]):
+                                            indexFiles.append(url)
+                                            if byHash:
+                                                indexFiles.append(patterns["i18nByHash"] + hashPath)
+                                        elif filename.startswith(patterns["translations"]):
+                                            indexFiles.append(url)
+                                            if byHash:
+                                                indexFiles.append(patterns["i18nByHash"] + hashPath)
+                                        elif patterns["dep11"].match(filename):
+                                            indexFiles.append(url)
+                                            if byHash:
+                                                indexFiles.append(patterns["dep11ByHash"] + hashPath)
                                 else:
-                                    indexFiles.append(f"{baseUrl}{filename}")
-                                    self._packageCollection.Add("Flat", architecture, f"{baseUrl}{filename}")
+                                    indexFiles.append(url)
+                                    self._packageCollection.Add("Flat", architecture, url)
 
                         elif self._repositoryType == RepositoryType.Src:
-                            for component in self._components:
-                                if re.match(rf"{component}/source/Release", filename):
-                                    indexFiles.append(f"{baseUrl}{filename}")
-
-                                if re.match(rf"{component}/source/Sources[^./]*(\.gz|\.bz2|\.xz|$)$", filename):
-                                    indexFiles.append(f"{baseUrl}{filename}")
-                                    self._sourceCollection.Add(component, f"{baseUrl}{filename}")
+                            for component, patterns in sourcePatterns:
+                                if filename.startswith(patterns["release"]):
+                                    indexFiles.append(url)
+                                elif filename.startswith(patterns["sources"]) and _indexFileTailPattern.match(filename, len(patterns["sources"])):
+                                    indexFiles.append(url)
+                                    self._sourceCollection.Add(component, url)
                     else:
                         checksums = False
                 else:
-                    checksums = "SHA256:" in line or "SHA1:" in line or "MD5Sum:" in line
+                    checksums = checksumField
 
         if self._repositoryType == RepositoryType.Bin:
             self._packageCollection.DetermineCurrentTimestamps()
@@ -349,8 +397,9 @@ class Repository:
 
         fileList = [] # type: list[Package]
 
+        indexRoot = Settings.SkelPath()
         for file in tqdm.tqdm(indices, position=1, unit=" index", desc="Indices      ", leave=False, disable=not Settings.ProgressBarsEnabled()):
-            fileList += self._ProcessIndex(Settings.SkelPath(), file, False)
+            fileList += self._ProcessIndex(indexRoot, file, False)
 
         return fileList
 
@@ -366,8 +415,9 @@ class Repository:
 
         fileList = [] # type: list[Package]
 
+        indexRoot = Settings.MirrorPath()
         for file in tqdm.tqdm(indices, position=1, unit=" index", desc="Indices      ", leave=False, disable=not Settings.ProgressBarsEnabled()):
-            fileList += self._ProcessIndex(Settings.MirrorPath(), file, True)
+            fileList += self._ProcessIndex(indexRoot, file, True)
 
         return fileList
 
@@ -389,8 +439,9 @@ class Repository:
 
         fileList = [] # type: list[Package]
 
+        indexRoot = Settings.SkelPath()
         for file in tqdm.tqdm(indices, position=1, unit=" index", desc="Indices      ", leave=False, disable=not Settings.ProgressBarsEnabled()):
-            fileList += self._ProcessIndex(Settings.SkelPath(), file, True)
+            fileList += self._ProcessIndex(indexRoot, file, True)
 
         return [x.Filename for x in fileList if x.Latest]
 
@@ -404,8 +455,7 @@ class Repository:
 
         logger.debug(f"Checking repo exists: {repositoryDirectory}")
 
-        path = Path(repositoryDirectory)
-        return os.path.isdir(path.parent.absolute())
+        return os.path.isdir(os.path.dirname(os.path.abspath(repositoryDirectory)))
 
     def _ProcessIndex(self, indexRoot: str, index: str, skipUpdateCheck: bool) -> list[Package]:
         """
@@ -435,32 +485,28 @@ class Repository:
         for package in tqdm.tqdm(packages, position=2, unit=" pkgs", desc="Packages     ", leave=False, delay=0.5, disable=not Settings.ProgressBarsEnabled()):
             if "Filename" in package:
                 # Packages Index
-                filename = package["Filename"]
-
-                if filename.startswith("./"):
-                    filename = filename[2:]
+                filename = package["Filename"].removeprefix("./")
+                size     = int(package["Size"])
 
-                packageList.append(Package(os.path.normpath(f"{path}/{filename}"), int(package["Size"]), skipUpdateCheck or not self._NeedUpdate(os.path.normpath(f"{mirror}/{filename}"), int(package["Size"]))))
+                packageList.append(Package(os.path.normpath(f"{path}/{filename}"), size, skipUpdateCheck or not self._NeedUpdate(os.path.normpath(f"{mirror}/{filename}"), size)))
             else:
                 # Sources Index
                 for key, value in package.items():
                     if "Files" in key:
                         files = list(filter(None, value.splitlines())) # type: list[str]
+                        directory = package["Directory"]
                         for file in files:
-                            directory = package["Directory"]
                             sourceFile = file.split(" ")
 
                             size = int(sourceFile[1])
-                            filename = sourceFile[2]
-
-                            if filename.startswith("./"):
-                                filename = filename[2:]
+                            filename = sourceFile[2].removeprefix("./")
 
                             packageList.append(Package(os.path.normpath(f"{path}/{directory}/{filename}"), size, skipUpdateCheck or not self._NeedUpdate(os.path.normpath(f"{mirror}/{directory}/{filename}"), size)))
 
-        if [x for x in packageList if not x.Latest]:
-            logger.debug(f"Packages to update ({len([x for x in packageList if not x.Latest])}):")
-            for pkg in [x.Filename for x in packageList if not x.Latest]:
+        outdated = [x.Filename for x in packageList if not x.Latest]
+        if outdated:
+            logger.debug(f"Packages to update ({len(outdated)}):")
+            for pkg in outdated:
                 logger.debug(f"\t{pkg}")
 
         return packageList
@@ -554,10 +600,10 @@ class Repository:
         """Get whether any of the files in this Repository have been modified."""
 
         if self._repositoryType == RepositoryType.Bin:
-            return len(self._packageCollection.ModifiedFiles) > 0
+            return self._packageCollection.Modified
 
         if self._repositoryType == RepositoryType.Src:
-            return len(self._sourceCollection.ModifiedFiles) > 0
+            return self._sourceCollection.Modified
 
         return True
 
@@ -609,6 +655,11 @@ class IndexCollection(ABC):
     def DetermineDownloadTimestamps(self):
         """Record the current Timestamp of a file after download."""
 
+    @property
+    @abstractmethod
+    def Modified(self) -> bool:
+        """Get whether any file in this collection has been modified, or if there are any files when Force is enabled."""
+
     @property
     def ModifiedFiles(self) -> list:
         """Get a list of all modified files in this collection or all if Force is enabled."""
@@ -645,12 +696,14 @@ class PackageCollection(IndexCollection):
         """For each file stored in this collection, determine the current timestamp of the file, and record it."""
 
         logger.debug("Getting timestamps of current files in Skel (if available)")
+        skelPath = Settings.SkelPath()
         # Gather timestamps for all files (that exist)
         for component in self._packageCollection:
             for architecture in self._packageCollection[component]:
                 for file in self._packageCollection[component][architecture]:
-                    if os.path.isfile(f"{Settings.SkelPath()}/{file}"):
-                        self._packageCollection[component][architecture][file].Current = os.path.getmtime(Path(f"{Settings.SkelPath()}/{SanitiseUri(file)}"))
+                    skelFile = f"{skelPath}/{file}" # Files are sanitised when added
+                    if os.path.isfile(skelFile):
+                        self._packageCollection[component][architecture][file].Current = os.path.getmtime(skelFile)
                         logger.debug(f"\tCurrent: [{component}] [{architecture}] [{file}]: {self._packageCollection[component][architecture][file].Current}")
 
     def DetermineDownloadTimestamps(self):
@@ -665,11 +718,13 @@ class PackageCollection(IndexCollection):
             for architecture in self._packageCollection[component]:
                 removables[component][architecture] = list()
 
+        skelPath = Settings.SkelPath()
         for component in self._packageCollection:
             for architecture in self._packageCollection[component]:
                 for file in self._packageCollection[component][architecture]:
-                    if os.path.isfile(f"{Settings.SkelPath()}/{file}"):
-                        self._packageCollection[component][architecture][file].Download = os.path.getmtime(Path(f"{Settings.SkelPath()}/{SanitiseUri(file)}"))
+                    skelFile = f"{skelPath}/{file}" # Files are sanitised when added
+                    if os.path.isfile(skelFile):
+                        self._packageCollection[component][architecture][file].Download = os.path.getmtime(skelFile)
                         logger.debug(f"\tDownload: [{component}] [{architecture}] [{file}]: {self._packageCollection[component][architecture][file].Download}")
                     else:
                         # File does not exist after download, therefore it does not exist in the repository, and can be marked for removal
@@ -685,7 +740,8 @@ class PackageCollection(IndexCollection):
     def _GetFiles(self, modified: bool) -> list:
         """Get a list of all files based on whether they have been modified or not."""
 
-        files = [] # type: list[str]
+        files = set() # type: set[str]
+        addAll = Settings.PreviousRunInterrupted() or Settings.ForceUpdate()
 
         for component in self._packageCollection:
             for architecture in self._packageCollection[component]:
@@ -694,15 +750,30 @@ class PackageCollection(IndexCollection):
                     addFile = False
 
                     if modified:
-                        addFile = self._packageCollection[component][architecture][file].Modified or Settings.PreviousRunInterrupted() or Settings.ForceUpdate()
+                        addFile = self._packageCollection[component][architecture][file].Modified or addAll
                     else:
-                        addFile = not self._packageCollection[component][architecture][file].Modified or Settings.PreviousRunInterrupted() or Settings.ForceUpdate()
+                        addFile = not self._packageCollection[component][architecture][file].Modified or addAll
 
                     if addFile:
                         filename, _ = os.path.splitext(file)
-                        files.append(filename)
+                        files.add(filename) # Ensure uniqueness due to stripped extension
+
+        return list(files)
+
+    @property
+    def Modified(self) -> bool:
+        """Get whether any file in this collection has been modified, or if there are any files when Force is enabled."""
+
+        addAll = Settings.PreviousRunInterrupted() or Settings.ForceUpdate()
 
-        return list(set(files)) # Ensure uniqueness due to stripped extension
+        # Stop at the first file found, rather than building the full list of ModifiedFiles
+        for component in self._packageCollection:
+            for architecture in self._packageCollection[component]:
+                for timestamp in self._packageCollection[component][architecture].values():
+                    if timestamp.Modified or addAll:
+                        return True
+
+        return False
 
 class SourceCollection(IndexCollection):
     """
@@ -729,11 +800,13 @@ class SourceCollection(IndexCollection):
         """For each file stored in this collection, determine the current timestamp of the file, and record it."""
 
         logger.debug("Getting timestamps of current files in Skel (if available)")
+        skelPath = Settings.SkelPath()
         # Gather timestamps for all files (that exist)
         for component in self._sourceCollection:
             for file in self._sourceCollection[component]:
-                if os.path.isfile(f"{Settings.SkelPath()}/{file}"):
-                    self._sourceCollection[component][file].Current = os.path.getmtime(Path(f"{Settings.SkelPath()}/{SanitiseUri(file)}"))
+                skelFile = f"{skelPath}/{file}" # Files are sanitised when added
+                if os.path.isfile(skelFile):
+                    self._sourceCollection[component][file].Current = os.path.getmtime(skelFile)
                     logger.debug(f"\tCurrent: [{component}] [{file}]: {self._sourceCollection[component][file].Current}")
 
     def DetermineDownloadTimestamps(self):
@@ -747,10 +820,12 @@ class SourceCollection(IndexCollection):
         for component in self._sourceCollection:
             removables[component] = list()
 
+        skelPath = Settings.SkelPath()
         for component in self._sourceCollection:
             for file in self._sourceCollection[component]:
-                if os.path.isfile(f"{Settings.SkelPath()}/{file}"):
-                    self._sourceCollection[component][file].Download = os.path.getmtime(Path(f"{Settings.SkelPath()}/{SanitiseUri(file)}"))
+                skelFile = f"{skelPath}/{file}" # Files are sanitised when added
+                if os.path.isfile(skelFile):
+                    self._sourceCollection[component][file].Download = os.path.getmtime(skelFile)
                     logger.debug(f"\tDownload: [{component}] [{file}]: {self._sourceCollection[component][file].Download}")
                 else:
                     # File does not exist after download, therefore it does not exist in the repository, and can be marked for removal
@@ -765,7 +840,8 @@ class SourceCollection(IndexCollection):
     def _GetFiles(self, modified: bool) -> list:
         """Get a list of all files based on whether they have been modified or not."""
 
-        files = [] # type: list[str]
+        files = set() # type: set[str]
+        addAll = Settings.PreviousRunInterrupted() or Settings.ForceUpdate()
 
         for component in self._sourceCollection:
             for file in self._sourceCollection[component]:
@@ -773,15 +849,29 @@ class SourceCollection(IndexCollection):
                 addFile = False
 
                 if modified:
-                    addFile = self._sourceCollection[component][file].Modified or Settings.PreviousRunInterrupted() or Settings.ForceUpdate()
+                    addFile = self._sourceCollection[component][file].Modified or addAll
                 else:
-                    addFile = not self._sourceCollection[component][file].Modified or Settings.PreviousRunInterrupted() or Settings.ForceUpdate()
+                    addFile = not self._sourceCollection[component][file].Modified or addAll
 
                 if addFile:
                     filename, _ = os.path.splitext(file)
-                    files.append(filename)
+                    files.add(filename) # Ensure uniqueness due to stripped extension
+
+        return list(files)
+
+    @property
+    def Modified(self) -> bool:
+        """Get whether any file in this collection has been modified, or if there are any files when Force is enabled."""
 
-        return list(set(files)) # Ensure uniqueness due to stripped extension
+        addAll = Settings.PreviousRunInterrupted() or Settings.ForceUpdate()
+
+        # Stop at the first file found, rather than building the full list of ModifiedFiles
+        for component in self._sourceCollection:
+            for timestamp in self._sourceCollection[component].values():
+                if timestamp.Modified or addAll:
+                    return True
+
+        return False
 
 @dataclass
 class Downloader:
@@ -810,7 +900,7 @@ class Downloader:
             logger.info("No files to download")
             return
 
-        arguments = Downloader.CustomArguments()
+        arguments = " ".join(Downloader.CustomArguments()) # Joined once here rather than for every Url
 
         logger.info(f"Downloading {len(urls)} {kind.name} files...")
 
@@ -820,7 +910,7 @@ class Downloader:
                 pass
 
     @staticmethod
-    def DownloadUrlsProcess(url: str, kind: str, args: list, logPath: str, rateLimit: str):
+    def DownloadUrlsProcess(url: str, kind: str, args: str, logPath: str, rateLimit: str):
         """Worker method for downloading a particular Url, used in multiprocessing."""
         process = multiprocessing.current_process()
 
@@ -838,7 +928,7 @@ class Downloader:
         command = f"{baseCommand} {rateLimit} {retries} {recursiveOpts} {logFile} {normalisedUrl}"
 
         if args:
-            command += f" {' '.join(args)}"
+            command += f" {args}"
 
         with filelock.FileLock(f"{filename}.lock"):
             with open(filename, "w") as f:
@@ -919,8 +1009,6 @@ class Index:
         packages = []    # type: list[dict[str,str]]
         package = dict() # type: dict[str,str]
 
-        keywords = ["Filename", "MD5sum", "SHA1", "SHA256", "Size", "Files", "Directory"]
-
         key = None
 
         for line in self._lines:
@@ -928,15 +1016,13 @@ class Index:
                 packages.append(package)
                 package = dict()
             else:
-                match = re.search(r"^([\w\-]+:)", line)
-                if not match and key:
+                if key and line[0] in " \t":
                     # Value continues on next line, append data
                     package[key] += f"\n{line.strip()}"
                 else:
-                    key = line.split(":")[0]
-                    if key in keywords:
-                        value = line.split(":")[1].strip()
-                        package[key] = value
+                    key, _, value = line.partition(":")
+                    if key in _indexKeywords:
+                        package[key] = value.strip()
                     else:
                         # Ignore, we don't need it
                         key = None
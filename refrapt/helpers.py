@@ -7,13 +7,18 @@ import lzma
 import bz2
 import shutil
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+_schemePattern = re.compile(r"^(\w+)://")
+_portPattern   = re.compile(r":\d+")
+
+@lru_cache(maxsize=8192) # The same Uris are sanitised repeatedly for each Repository and file
 def SanitiseUri(uri: str) -> str:
     """Sanitise a Uri so it is suitable for filesystem use."""
-    uri = re.sub(r"^(\w+)://", "", uri)
-    uri = re.sub(r":\d+", "", uri) # Port information
+    uri = _schemePattern.sub("", uri)
+    uri = _portPattern.sub("", uri) # Port information
 
     return uri
 
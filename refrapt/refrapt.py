@@ -11,7 +11,7 @@ import shutil
 import datetime
 
 import site
-import pkg_resources
+from importlib import metadata
 
 import click
 import tqdm
@@ -36,7 +36,7 @@ filesToKeep = [] # type : list[str]
 appLockFile = "refrapt-lock"
 
 @click.command()
-@click.version_option(pkg_resources.require("refrapt")[0].version)
+@click.version_option(metadata.version("refrapt"))
 @click.option("--conf", default=f"{Settings.GetRootPath()}/refrapt.conf", help="Path to configuration file.", type=click.STRING)
 @click.option("--test", is_flag=True, default=False, help="Do not perform the main download for any .deb or source files, and do not perform any cleaning.", type=click.BOOL)
 @click.option("--clean", is_flag=True, default=False, help="Clean all mirrors of unrequired files.", type=click.BOOL)
@@ -177,8 +177,8 @@ def PerformClean():
         fileList += repository.ParseIndexFilesFromLocalMirror()
 
     # Packages potentially add duplicates - remove duplicates now
-    requiredFiles = [] # type: list[str]
-    requiredFiles = list(set(filesToKeep)) + [x.Filename for x in fileList]
+    requiredFiles = set(filesToKeep) # type: set[str]
+    requiredFiles.update(x.Filename for x in fileList)
 
     os.chdir(Settings.MirrorPath())
 
@@ -255,30 +255,33 @@ def PerformMirroring():
         logger.debug(f"\t{file}")
 
     # 5. Perform the main download of Binary and Source files
-    downloadSize = ConvertSize(sum([x.Size for x in filesToDownload if not x.Latest]))
-    logger.info(f"Compiled a list of {len([x for x in filesToDownload if not x.Latest])} Binary and Source files of size {downloadSize} for download")
+    outdatedFiles = [x for x in filesToDownload if not x.Latest]
+    downloadSize = ConvertSize(sum([x.Size for x in outdatedFiles]))
+    logger.info(f"Compiled a list of {len(outdatedFiles)} Binary and Source files of size {downloadSize} for download")
 
     os.chdir(Settings.MirrorPath())
     if not Settings.Test():
-        Downloader.Download([x.Filename for x in filesToDownload if not x.Latest], UrlType.Archive)
+        Downloader.Download([x.Filename for x in outdatedFiles], UrlType.Archive)
 
     # 6. Copy Skel to Main Archive
     if not Settings.Test():
         print()
         logger.info("Copying Skel to Mirror")
+        skelPath   = Settings.SkelPath()
+        mirrorPath = Settings.MirrorPath()
         for indexUrl in tqdm.tqdm(filesToKeep, unit=" files", disable=not Settings.ProgressBarsEnabled()):
-            skelFile   = f"{Settings.SkelPath()}/{SanitiseUri(indexUrl)}"
+            skelFile   = f"{skelPath}/{SanitiseUri(indexUrl)}"
             if os.path.isfile(skelFile):
-                mirrorFile = f"{Settings.MirrorPath()}/{SanitiseUri(indexUrl)}"
+                mirrorFile = f"{mirrorPath}/{SanitiseUri(indexUrl)}"
                 copy = True
                 if os.path.isfile(mirrorFile):
                     # Compare files using Timestamp to save moving files that don't need to be
-                    skelTimestamp   = os.path.getmtime(Path(skelFile))
-                    mirrorTimestamp = os.path.getmtime(Path(mirrorFile))
+                    skelTimestamp   = os.path.getmtime(skelFile)
+                    mirrorTimestamp = os.path.getmtime(mirrorFile)
                     copy = skelTimestamp > mirrorTimestamp
 
                 if copy:
-                    os.makedirs(Path(mirrorFile).parent.absolute(), exist_ok=True)
+                    os.makedirs(os.path.dirname(os.path.abspath(mirrorFile)), exist_ok=True)
                     shutil.copyfile(skelFile, mirrorFile)
 
     # 7. Remove any unused files
@@ -359,7 +362,7 @@ def CreateConfig(conf: str):
 
     logger.info(f"Configuration file created for first use at '{conf}'. Add some Repositories and run again. Application exiting.")
 
-def Clean(repos: list, requiredFiles: list):
+def Clean(repos: list, requiredFiles: set):
     """Compiles a list of files to clean, and then removes them from disk"""
 
     # 5. Determine which files are in the mirror, but not listed in the Index files
@@ -371,10 +374,10 @@ def Clean(repos: list, requiredFiles: list):
         walked = [] # type: list[str]
         for root, _, files in tqdm.tqdm(os.walk(SanitiseUri(uri)), position=1, unit=" fso", desc="FSO          ", leave=False, delay=0.5, disable=not Settings.ProgressBarsEnabled()):
             for file in tqdm.tqdm(files, position=2, unit=" file", desc="Files        ", leave=False, delay=0.5, disable=not Settings.ProgressBarsEnabled()):
-                walked.append(os.path.join(root, file))
+                walked.append(os.path.normpath(os.path.join(root, file)))
 
         logger.debug(f"{SanitiseUri(uri)}: Walked {len(walked)} items")
-        items += [os.path.normpath(x) for x in walked if os.path.normpath(x) not in requiredFiles and not os.path.islink(x)]
+        items += [x for x in walked if x not in requiredFiles and not os.path.islink(x)]
 
     # 5a. Remove any duplicate items
     items = list(set(items))
@@ -447,8 +450,8 @@ def PostMirrorClean():
 
     # Packages potentially add duplicate downloads, slowing down the rest
     # of the process. To counteract, remove duplicates now
-    requiredFiles = [] # type: list[str]
-    requiredFiles = list(set(filesToKeep)) + list(set(umodifiedFiles))
+    requiredFiles = set(filesToKeep) # type: set[str]
+    requiredFiles.update(umodifiedFiles)
 
     Clean(cleanRepositories, requiredFiles)
 
@@ -1,22 +1,72 @@
-import multiprocessing
+import os
+import re
 import logging
 from pathlib import Path
 import platform
 import locale
+import sys
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# "set <key> = <value>", with any inline comment excluded from the value
+_settingPattern = re.compile(r"\s*set\s+([^=]+?)\s*=([^#]*)")
+
+@lru_cache(maxsize=None)
+def _DefaultRootPath() -> str:
+    """Get the default root path within the user's home directory."""
+    return os.path.join(Path.home(), "refrapt")
+
+def _ParseString(value: str) -> str:
+    """Parse a string setting, removing any surrounding quotes."""
+    return sys.intern(value.strip().strip('"'))
+
+def _ParseInt(value: str) -> int:
+    """Parse an integer setting."""
+    return int(_ParseString(value))
+
+_booleans = {
+    "true" : True,
+    "yes"  : True,
+    "on"   : True,
+    "1"    : True,
+    "false": False,
+    "no"   : False,
+    "off"  : False,
+    "0"    : False
+}
+
+def _ParseBool(value: str) -> bool:
+    """Parse a boolean setting."""
+    value = _ParseString(value).lower()
+    try:
+        return _booleans[value]
+    except KeyError:
+        raise ValueError(f"'{value}' is not a boolean") from None
+
+def _ParseLanguage(value: str) -> list:
+    """Parse a comma separated list of Languages."""
+    # More than 1 Language may be specified
+    return [sys.intern(language) for language in value.replace(" ", "").strip('"').split(",")]
+
+def _ParseLogLevel(value: str) -> str:
+    """Parse a log level name, ensuring it is known to the logging module."""
+    value = _ParseString(value)
+    if value not in logging._nameToLevel:
+        raise ValueError(f"'{value}' is not a valid log level")
+    return value
+
 class Settings:
     """Contains the loaded settings for the application."""
 
     _settings = {
-        "architecture"      : platform.machine().lower(),
-        "rootPath"          : f"{str(Path.home())}/refrapt",
-        "mirrorPath"        : f"{str(Path.home())}/refrapt/mirror",
-        "skelPath"          : f"{str(Path.home())}/refrapt/skel",
-        "varPath"           : f"{str(Path.home())}/refrapt/var",
+        "architecture"      : None, # Determined on first use
+        "rootPath"          : None, # Determined on first use
+        "mirrorPath"        : None, # Determined on first use
+        "skelPath"          : None, # Determined on first use
+        "varPath"           : None, # Determined on first use
         "contents"          : True,
-        "threads"           : multiprocessing.cpu_count(),
+        "threads"           : None, # Determined on first use
         "authNoChallenge"   : False,
         "noCheckCertificate": False,
         "unlink"            : False,
@@ -29,7 +79,7 @@ class Settings:
         "caCertificate"     : "",
         "privateKey"        : "",
         "limitRate"         : "500m", # Wget syntax
-        "language"          : [locale.getdefaultlocale()[0]],
+        "language"          : None, # Determined on first use
         "forceUpdate"       : False,  # Use this to flag every single file as requiring an update, regardless of if the size matches. Use this if you know a file has changed, but you still have the old version (sizes were equal)
         "logLevel"          : "INFO",
         "test"              : False,
@@ -38,50 +88,103 @@ class Settings:
         "disableProgress"   : False
     }
     _previousRunInterrupted = False
+    _logLevel = logging.INFO # Resolved from the "logLevel" setting after parsing
+
+    # Parser for each setting, resolved once rather than inspecting values on every line
+    _schema = {
+        "architecture"      : _ParseString,
+        "rootPath"          : _ParseString,
+        "mirrorPath"        : _ParseString,
+        "skelPath"          : _ParseString,
+        "varPath"           : _ParseString,
+        "contents"          : _ParseBool,
+        "threads"           : _ParseInt,
+        "authNoChallenge"   : _ParseBool,
+        "noCheckCertificate": _ParseBool,
+        "unlink"            : _ParseBool,
+        "useProxy"          : _ParseBool,
+        "httpProxy"         : _ParseString,
+        "httpsProxy"        : _ParseString,
+        "proxyUser"         : _ParseString,
+        "proxyPass"         : _ParseString,
+        "certificate"       : _ParseString,
+        "caCertificate"     : _ParseString,
+        "privateKey"        : _ParseString,
+        "limitRate"         : _ParseString,
+        "language"          : _ParseLanguage,
+        "forceUpdate"       : _ParseBool,
+        "logLevel"          : _ParseLogLevel,
+        "test"              : _ParseBool,
+        "byHash"            : _ParseBool,
+        "disableClean"      : _ParseBool,
+        "disableProgress"   : _ParseBool
+    }
+
+    @staticmethod
+    def ParseText(config: str):
+        """Parse the contents of a configuration file and set the settings defined."""
+        Settings.Parse(config.splitlines())
 
     @staticmethod
     def Parse(config: list):
         """Parse the configuration file and set the settings defined."""
+        settings = Settings._settings
+        schema   = Settings._schema
+
         for line in config:
-            if line.lstrip().startswith("set"):
-                key = line.lstrip().split("set ")[1].split("=")[0].strip()
-
-                if key in Settings._settings:
-                    value = line.split("=")[1].strip().split("#", 1)[0] # Allow for inline comments, but strip them here
-
-                    if value.isdigit():
-                        Settings._settings[key] = int(value)
-                    elif "true" in value.lower() or "false" in value.lower():
-                        Settings._settings[key] = value.lower() == "true"
-                    elif isinstance(Settings._settings[key], list):
-                        if key == "language":
-                            # More than 1 Language may be specified
-                            Settings._settings[key] = value.replace(" ", "").strip('"').split(",")
-                    else:
-                        Settings._settings[key] = value.strip().strip('"')
-
-                    logger.debug(f"Parsed setting: {key} = {Settings._settings.get(key)}")
-                else:
-                    logger.warning(f"Unknown setting in configuration file '{line}'")
+            # Most lines are comments or Repositories, so skip them before attempting a match
+            if not line.lstrip().startswith("set "):
+                continue
+
+            match = _settingPattern.match(line)
+            if match is None:
+                logger.warning(f"Malformed setting in configuration file '{line}'")
+                continue
+
+            key = sys.intern(match.group(1))
+
+            parser = schema.get(key)
+            if parser is None:
+                logger.warning(f"Unknown setting in configuration file '{line}'")
+                continue
+
+            value = match.group(2).strip()
+
+            try:
+                settings[key] = parser(value)
+            except ValueError as e:
+                logger.warning(f"Invalid value for setting '{key}' in configuration file: {e}")
+                continue
+
+            logger.debug(f"Parsed setting: {key} = {settings[key]}")
 
         Settings._StripToLanguage()
+        Settings._logLevel = logging._nameToLevel[settings["logLevel"]]
+
+    @staticmethod
+    def _GetOrDefault(key: str, default):
+        """Get a setting, determining and storing its default on first use if it was not set."""
+        value = Settings._settings[key]
+        if value is None:
+            value = Settings._settings[key] = default()
+        return value
 
     @staticmethod
     def _StripToLanguage():
         """Strip Region / Script codes from Language codes in order to capture more files."""
 
-        languages = Settings.Language()
-        for index, localeVar in enumerate(languages):
-            if "_" in localeVar:
-                Settings._settings["language"][index] = localeVar.split("_")[0]
+        languages = [localeVar.split("_")[0] for localeVar in Settings.Language()]
 
         # There may be duplicates if multiple entries used the same Language, so strip them out
-        Settings._settings["language"] = list(set(Settings._settings["language"]))
+        if len(languages) > 1:
+            languages = list(set(languages))
+
+        Settings._settings["language"] = languages
 
     @staticmethod
     def Test() -> bool:
         """Get whether Test mode is enabled."""
-        return bool(Settings._settings["test"])
+        return Settings._settings["test"]
 
     @staticmethod
     def EnableTest():
@@ -91,102 +194,102 @@ class Settings:
     @staticmethod
     def Architecture() -> str:
         """Get the default Architecture."""
-        return str(Settings._settings["architecture"])
+        return Settings._GetOrDefault("architecture", lambda: platform.machine().lower())
 
     @staticmethod
     def GetRootPath() -> str:
         """Get the root path."""
-        return str(Settings._settings["rootPath"])
+        return Settings._GetOrDefault("rootPath", _DefaultRootPath)
 
     @staticmethod
     def MirrorPath() -> str:
         """Get the path to the /mirror directory."""
-        return str(Settings._settings["mirrorPath"])
+        return Settings._GetOrDefault("mirrorPath", lambda: os.path.join(_DefaultRootPath(), "mirror"))
 
     @staticmethod
     def SkelPath() -> str:
         """Get the path to the /skel directory."""
-        return str(Settings._settings["skelPath"])
+        return Settings._GetOrDefault("skelPath", lambda: os.path.join(_DefaultRootPath(), "skel"))
 
     @staticmethod
     def VarPath() -> str:
         """Get the path to the /var directory."""
-        return str(Settings._settings["varPath"])
+        return Settings._GetOrDefault("varPath", lambda: os.path.join(_DefaultRootPath(), "var"))
 
     @staticmethod
     def Contents() -> bool:
         """Get whether Contents files should be included."""
-        return bool(Settings._settings["contents"])
+        return Settings._settings["contents"]
 
     @staticmethod
     def Threads() -> int:
         """Get the number of threads to use for multiprocessing tasks."""
-        return int(str(Settings._settings["threads"]))
+        return Settings._GetOrDefault("threads", lambda: os.cpu_count() or 1)
 
     @staticmethod
     def AuthNoChallege() -> bool:
         """Get whether Wget should use the --auth-no-challenge parameter."""
-        return bool(Settings._settings["authNoChallenge"])
+        return Settings._settings["authNoChallenge"]
 
     @staticmethod
     def NoCheckCertificate() -> bool:
         """Get whether Wget should use the --no-check-certificate parameter."""
-        return bool(Settings._settings["noCheckCertificate"])
+        return Settings._settings["noCheckCertificate"]
 
     @staticmethod
     def Unlink() -> bool:
         """Get whether Wget should use the --unlink parameter."""
-        return bool(Settings._settings["unlink"])
+        return Settings._settings["unlink"]
 
     @staticmethod
     def UseProxy() -> bool:
         """Get whether Wget should use the -e use_proxy=yes parameter."""
-        return bool(Settings._settings["useProxy"])
+        return Settings._settings["useProxy"]
 
     @staticmethod
     def HttpProxy() -> str:
         """Get the httpProxy setting."""
-        return str(Settings._settings["httpProxy"])
+        return Settings._settings["httpProxy"]
 
     @staticmethod
     def HttpsProxy() -> str:
         """Get the httpsProxy setting."""
-        return str(Settings._settings["httpsProxy"])
+        return Settings._settings["httpsProxy"]
 
     @staticmethod
     def ProxyUser() -> str:
         """Get the proxyUser setting."""
-        return str(Settings._settings["proxyUser"])
+        return Settings._settings["proxyUser"]
 
     @staticmethod
     def ProxyPassword() -> str:
         """Get the proxyPass setting."""
-        return str(Settings._settings["proxyPass"])
+        return Settings._settings["proxyPass"]
 
     @staticmethod
     def Certificate() -> str:
         """Get the certificate setting for SSL."""
-        return str(Settings._settings["certificate"])
+        return Settings._settings["certificate"]
 
     @staticmethod
     def CaCertificate() -> str:
         """Get the ca certificate setting for SSL."""
-        return str(Settings._settings["caCertificate"])
+        return Settings._settings["caCertificate"]
 
     @staticmethod
     def PrivateKey() -> str:
         """Get the private key setting for SSL."""
-        return str(Settings._settings["privateKey"])
+        return Settings._settings["privateKey"]
 
     @staticmethod
     def LimitRate() -> str:
         """Get the value of the --limit-rate setting used for Wget."""
-        return str(Settings._settings["limitRate"])
+        return Settings._settings["limitRate"]
 
     @staticmethod
     def Language() -> list[str]:
         """Get the languge setting."""
-        return list(Settings._settings["language"])
+        return Settings._GetOrDefault("language", lambda: [locale.getdefaultlocale()[0]])
 
     @staticmethod
     def SetForceUpdate():
@@ -196,17 +299,17 @@ class Settings:
     @staticmethod
     def ForceUpdate() -> bool:
         """Get whether updates of files should be forced."""
-        return bool(Settings._settings["forceUpdate"])
+        return Settings._settings["forceUpdate"]
 
     @staticmethod
     def LogLevel() -> int:
         """Get the log level used for application logger."""
-        return int(logging._nameToLevel[str(Settings._settings["logLevel"])])
+        return Settings._logLevel
 
     @staticmethod
     def ByHash() -> bool:
         """Get whether the by-hash directories should be included in downloads."""
-        return bool(Settings._settings["byHash"])
+        return Settings._settings["byHash"]
 
     @staticmethod
     def SetPreviousRunInterrupted():
@@ -216,17 +319,17 @@ class Settings:
     @staticmethod
     def PreviousRunInterrupted() -> bool:
         """Get whether the application should force full processing in the event of an interrupted run."""
-        return bool(Settings._previousRunInterrupted)
+        return Settings._previousRunInterrupted
 
     @staticmethod
     def CleanEnabled() -> bool:
         """Get whether cleaning has been globally enabled."""
-        return bool(Settings._settings["disableClean"]) is False
+        return not Settings._settings["disableClean"]
 
     @staticmethod
     def ProgressBarsEnabled() -> bool:
         """Get whether progress bars are enabled."""
-        return bool(Settings._settings["disableProgress"]) is False
+        return not Settings._settings["disableProgress"]
 
     @staticmethod
     def DisableProgressBars():